@@ -6,56 +6,1160 @@ social media integration, license creation, and visual enhancements.
 """
 
 import argparse
+import ast
+import configparser
+import fnmatch
+import glob
+import hashlib
+import importlib.metadata
+import io
 import os
+import pathlib
+import queue
+import sys
+import threading
+import time
 from jinja2 import Template
 from InquirerPy import inquirer
 import git
 import json
 import random
-
-def get_repo_data():
-    """Extract repository information from git"""
+import re
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+
+try:
+    import tomllib
+except ImportError:
     try:
-        repo = git.Repo('.')
-        remote_url = None
-        last_commit = None
-        last_commit_date = None
-        dependencies = []
-
-        # Get remote URL
-        if repo.remotes:
-            remote_url = repo.remotes.origin.url if repo.remotes.origin else None
-
-        # Get last commit
-        if repo.heads:
-            last_commit_obj = repo.head.commit
-            last_commit = last_commit_obj.message.split('\n')[0][:50]
-            last_commit_date = last_commit_obj.committed_datetime.strftime('%Y-%m-%d')
-
-        # Try to extract dependencies from common files
-        if os.path.exists('requirements.txt'):
-            with open('requirements.txt', 'r') as f:
-                dependencies = [line.strip().split('==')[0] for line in f if line.strip() and not line.startswith('#')]
-
-        if os.path.exists('package.json'):
-            with open('package.json', 'r') as f:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Lockfiles checked for resolved dependency versions, in order of preference
+LOCKFILES = [
+    'package-lock.json',
+    'yarn.lock',
+    'pnpm-lock.yaml',
+    'poetry.lock',
+    'uv.lock',
+    'Cargo.lock',
+]
+
+def normalize_dep_name(dep):
+    """Reduce a dependency spec to a comparable package name"""
+    match = re.match(r'@?[A-Za-z0-9][A-Za-z0-9._/-]*', dep.strip())
+    name = match.group(0) if match else dep.strip()
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+def _parse_npm_lock(lines):
+    """Yield (name, version, range) from package-lock.json, one line at a time.
+
+    Top-level installs always satisfy the root's own ranges, so no range is reported.
+    """
+    current = None
+    in_legacy_deps = False
+    for line in lines:
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+
+        # lockfileVersion 2/3: top-level installs under "packages"
+        match = re.match(r'"node_modules/((?:@[^/"]+/)?[^/"]+)"\s*:\s*\{', stripped)
+        if match:
+            current = match.group(1)
+            continue
+
+        # lockfileVersion 1: direct entries under the top-level "dependencies"
+        if indent == 2 and stripped.startswith('"dependencies"'):
+            in_legacy_deps = True
+            continue
+        if in_legacy_deps and indent <= 2:
+            in_legacy_deps = False
+        if in_legacy_deps and indent == 4:
+            match = re.match(r'"([^"]+)"\s*:\s*\{', stripped)
+            if match:
+                current = match.group(1)
+                continue
+
+        if current and stripped.startswith('"version"'):
+            yield current, stripped.split(':', 1)[1].strip().rstrip(',').strip('"'), None
+            current = None
+
+def _parse_yarn_lock(lines):
+    """Yield (name, version, range) from yarn.lock (classic and berry)"""
+    specs = []
+    for line in lines:
+        if not line.strip() or line.startswith('#'):
+            continue
+        if not line[0].isspace():
+            specs = []
+            for spec in line.rstrip().rstrip(':').split(','):
+                spec = spec.strip().strip('"')
+                # Scoped names start with '@', so look for the range separator after it
+                name, separator, spec_range = spec[1:].partition('@')
+                specs.append((spec[0] + name, spec_range) if separator else (spec, None))
+        elif specs and line.strip().startswith('version'):
+            version = line.strip()[len('version'):].lstrip(':').strip().strip('"')
+            for name, spec_range in specs:
+                yield name, version, spec_range
+            specs = []
+
+def _parse_pnpm_lock(lines):
+    """Yield (name, version, range) from the importers section of pnpm-lock.yaml"""
+    section_indent = None
+    child_indent = None
+    pending = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip(' '))
+
+        # Resolved packages follow the importers; direct versions are all known by then
+        if indent == 0 and stripped in ('packages:', 'snapshots:'):
+            break
+
+        if section_indent is not None and indent <= section_indent:
+            section_indent = None
+        if stripped in ('dependencies:', 'devDependencies:', 'optionalDependencies:'):
+            section_indent = indent
+            child_indent = None
+            pending = None
+            continue
+        if section_indent is None:
+            continue
+
+        key, _, value = stripped.partition(':')
+        key = key.strip().strip('\'"')
+        value = value.strip().strip('\'"').split('(')[0]
+        if child_indent is None:
+            child_indent = indent
+        if indent == child_indent:
+            pending = None if value else key
+            if value:
+                yield key, value, None
+        elif pending and key == 'version':
+            yield pending, value, None
+            pending = None
+
+def _toml_lock_dependencies(text):
+    """Read (name, version) pairs from a lockfile dependencies array.
+
+    Cargo lists "name" or "name version (source)" strings, uv lists inline
+    tables such as { name = "x", version = "1.0" }; the version is only given
+    when several versions of the package are locked.
+    """
+    dependencies = []
+    depth = 0
+    item = ''
+    for char in text.strip()[1:-1] + ',':
+        depth += {'{': 1, '}': -1}.get(char, 0)
+        if char != ',' or depth:
+            item += char
+            continue
+        item = item.strip()
+        if item.startswith('{'):
+            # Only the table's own keys count, not those of nested tables like source
+            own_keys = re.sub(r'\{[^{}]*\}', '', item[1:-1])
+            name = re.search(r'\bname\s*=\s*"([^"]+)"', own_keys)
+            version = re.search(r'\bversion\s*=\s*"([^"]+)"', own_keys)
+            if name:
+                dependencies.append((name.group(1), version.group(1) if version else None))
+        elif item:
+            parts = item.strip('"').split(' ')
+            dependencies.append((parts[0], parts[1] if len(parts) > 1 else None))
+        item = ''
+    return dependencies
+
+def _parse_toml_lock(lines):
+    """Yield each [[package]] table of poetry, uv and Cargo lockfiles.
+
+    Packages are dicts with name, version, whether the source is the project
+    itself, and the dependencies array, read one line at a time.
+    """
+    package = None
+    in_package = False
+    dependencies_text = None
+    for line in lines:
+        stripped = line.strip()
+        if dependencies_text is not None:
+            dependencies_text += stripped
+            if stripped == ']':
+                package['dependencies'] = _toml_lock_dependencies(dependencies_text)
+                dependencies_text = None
+            continue
+        if stripped.startswith('['):
+            # Sub-tables like [package.metadata] still belong to the package, but end its top-level keys
+            if stripped == '[[package]]':
+                if package:
+                    yield package
+                package = {'name': None, 'version': None, 'is_root': False, 'dependencies': []}
+            in_package = stripped == '[[package]]'
+            continue
+        if not in_package or '=' not in stripped:
+            continue
+        key, _, value = stripped.partition('=')
+        key = key.strip()
+        value = value.strip()
+        if key == 'name':
+            package['name'] = value.strip('"')
+        elif key == 'version':
+            package['version'] = value.strip('"')
+        elif key == 'source' and re.match(r'\{\s*(editable|virtual)\s*=\s*"\."', value):
+            package['is_root'] = True
+        elif key == 'dependencies' and value.startswith('['):
+            if value.endswith(']') and value.count('[') == value.count(']'):
+                package['dependencies'] = _toml_lock_dependencies(value)
+            else:
+                dependencies_text = value
+    if package:
+        yield package
+
+def _resolve_toml_lock(lines, wanted, root_names):
+    """Pick versions of wanted packages, using the root package's entry when several are locked"""
+    candidates = {}
+    pinned = {}
+    for package in _parse_toml_lock(lines):
+        key = normalize_dep_name(package['name'] or '')
+        if key in wanted and package['version']:
+            candidates.setdefault(key, []).append(package['version'])
+        if package['is_root'] or key in root_names:
+            for name, version in package['dependencies']:
+                if version and normalize_dep_name(name) in wanted:
+                    pinned[normalize_dep_name(name)] = version
+
+    versions = {}
+    for key, locked in candidates.items():
+        if key in pinned:
+            versions[key] = pinned[key]
+        elif len(set(locked)) == 1:
+            versions[key] = locked[0]
+    return versions
+
+def _strip_protocol(spec_range):
+    """Drop the npm: protocol yarn berry adds to lockfile ranges"""
+    return spec_range[len('npm:'):] if spec_range.startswith('npm:') else spec_range
+
+def _match_lock_entries(entries, wanted, ranges):
+    """Pick versions of wanted packages, matching the requested range where the lockfile records it"""
+    versions = {}
+    for name, version, spec_range in entries:
+        key = normalize_dep_name(name)
+        if key not in wanted or key in versions:
+            continue
+        requested = ranges.get(wanted[key])
+        # Transitive dependencies can lock other versions of the same package under other ranges
+        if requested and spec_range is not None and _strip_protocol(spec_range) != _strip_protocol(requested):
+            continue
+        versions[key] = version
+        if len(versions) == len(wanted):
+            break
+    return versions
+
+LOCKFILE_PARSERS = {
+    'package-lock.json': _parse_npm_lock,
+    'yarn.lock': _parse_yarn_lock,
+    'pnpm-lock.yaml': _parse_pnpm_lock,
+}
+
+# Lockfiles made of [[package]] tables, which may lock several versions of one package
+TOML_LOCKFILES = ['poetry.lock', 'uv.lock', 'Cargo.lock']
+
+class _BlobReader(io.RawIOBase):
+    """Raw stream over a git blob, so it can be read incrementally.
+
+    The object stream is only requested on the first read, and whatever is left
+    is drained in chunks on close; GitPython would otherwise read the remainder
+    in one go when the stream is garbage collected.
+    """
+
+    def __init__(self, blob):
+        self._blob = blob
+        self._stream = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._stream is None:
+            self._stream = self._blob.data_stream
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if self._stream is not None and not self.closed:
+            while self._stream.read(1024 * 1024):
+                pass
+        super().close()
+
+def worktree_opener(root='.'):
+    """Return a function opening files from a checked-out working tree"""
+    def open_file(name):
+        path = os.path.join(root, name)
+        if not os.path.isfile(path):
+            return None
+        return open(path, 'r', encoding='utf-8', errors='replace')
+    return open_file
+
+def tree_opener(tree):
+    """Return a function opening files as blobs straight from a git tree"""
+    def open_file(name):
+        try:
+            blob = tree / name
+        except KeyError:
+            return None
+        if blob.type != 'blob':
+            return None
+        raw = _BlobReader(blob)
+        return io.TextIOWrapper(io.BufferedReader(raw), encoding='utf-8', errors='replace')
+    return open_file
+
+def get_locked_versions(dependencies, open_file=None, ranges=None, root_names=()):
+    """Resolve direct dependency versions by streaming through lockfiles.
+
+    ``ranges`` maps dependencies to the ranges the manifest requests, and
+    ``root_names`` names the project's own lockfile entry, so versions locked
+    only for transitive dependencies are not picked up.
+    """
+    open_file = open_file or worktree_opener()
+    wanted = {normalize_dep_name(dep): dep for dep in dependencies}
+    root_names = {normalize_dep_name(name) for name in root_names if name}
+    versions = {}
+
+    for lockfile in LOCKFILES:
+        if not wanted:
+            break
+        f = open_file(lockfile)
+        if f is None:
+            continue
+        # Lockfiles can be huge, so read line by line and keep only wanted entries
+        with f:
+            if lockfile in TOML_LOCKFILES:
+                found = _resolve_toml_lock(f, wanted, root_names)
+            else:
+                found = _match_lock_entries(LOCKFILE_PARSERS[lockfile](f), wanted, ranges or {})
+        for key, version in found.items():
+            versions[wanted.pop(key)] = version
+
+    return versions
+
+def get_cache_dir():
+    """Return the directory for persistent caches, creating it if needed"""
+    cache_dir = os.environ.get('README_GENERATOR_CACHE') or os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'readme-generator')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def _save_json_cache(path, data):
+    """Replace a JSON cache file without leaving a half-written file behind"""
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path), delete=False) as f:
+        json.dump(data, f)
+    os.replace(f.name, path)
+
+def _python_license(metadata):
+    """Pick the most useful license string from Python distribution metadata"""
+    license_name = metadata.get('License-Expression') or metadata.get('License') or ''
+    # Some projects paste the whole license text into the License field
+    if license_name and '\n' not in license_name.strip() and len(license_name) <= 60:
+        return license_name.strip()
+    classifiers = [c.split('::')[-1].strip() for c in metadata.get_all('Classifier') or [] if c.startswith('License ::')]
+    return ', '.join(classifiers)
+
+def _scan_site_packages(path, previous):
+    """Read metadata of Python distributions in a site-packages directory"""
+    dists = {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(('.dist-info', '.egg-info')) or not entry.is_dir():
+                continue
+            # The directory name carries name and version, so known entries are still valid
+            if entry.name in previous:
+                dists[entry.name] = previous[entry.name]
+                continue
+            try:
+                metadata = importlib.metadata.PathDistribution(pathlib.Path(entry.path)).metadata
+            except (OSError, ValueError):
+                continue
+            if not metadata or not metadata.get('Name'):
+                continue
+            dists[entry.name] = {
+                'name': metadata['Name'],
+                'version': metadata.get('Version') or '',
+                'license': _python_license(metadata),
+                'summary': metadata.get('Summary') or '',
+            }
+    return dists
+
+def _scan_node_modules(path, previous):
+    """Read metadata of npm packages installed in a node_modules directory"""
+    dists = {}
+    package_dirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            if entry.name.startswith('@'):
+                with os.scandir(entry.path) as scoped:
+                    package_dirs.extend((f'{entry.name}/{inner.name}', inner.path) for inner in scoped if inner.is_dir())
+            else:
+                package_dirs.append((entry.name, entry.path))
+
+    for name, package_dir in package_dirs:
+        manifest = os.path.join(package_dir, 'package.json')
+        try:
+            mtime = os.stat(manifest).st_mtime
+        except OSError:
+            continue
+        if name in previous and previous[name].get('mtime') == mtime:
+            dists[name] = previous[name]
+            continue
+        try:
+            with open(manifest, 'r', encoding='utf-8') as f:
                 package_data = json.load(f)
-                if 'dependencies' in package_data:
-                    dependencies = list(package_data['dependencies'].keys())
-
-        return {
-            'remote_url': remote_url,
-            'last_commit': last_commit,
-            'last_commit_date': last_commit_date,
-            'dependencies': dependencies[:10]  # Limit to 10 dependencies
-        }
-    except:
-        return {
-            'remote_url': None,
-            'last_commit': None,
-            'last_commit_date': None,
-            'dependencies': []
+        except (OSError, ValueError):
+            continue
+        license_name = package_data.get('license') or ''
+        if isinstance(license_name, dict):
+            license_name = license_name.get('type', '')
+        dists[name] = {
+            'name': package_data.get('name') or name,
+            'version': package_data.get('version') or '',
+            'license': license_name if isinstance(license_name, str) else '',
+            'summary': package_data.get('description') or '',
+            'mtime': mtime,
         }
+    return dists
+
+def _is_within(path, root):
+    """Check whether path is root or somewhere below it"""
+    path, root = os.path.realpath(path), os.path.realpath(root)
+    try:
+        return os.path.commonpath([path, root]) == root
+    except ValueError:
+        return False
+
+def get_dist_sources(*roots):
+    """List directories holding installed distributions for the given project roots.
+
+    The active Python environment only counts when it belongs to the project:
+    when it is run from inside the project or the environment lives in it.
+    """
+    sources = []
+    for root in roots:
+        sources.append(os.path.join(root, 'node_modules'))
+        for venv in ('.venv', 'venv'):
+            sources.extend(sorted(glob.glob(os.path.join(root, venv, 'lib', 'python*', 'site-packages'))))
+            sources.append(os.path.join(root, venv, 'Lib', 'site-packages'))
+    if any(_is_within(os.getcwd(), root) or _is_within(sys.prefix, root) for root in roots):
+        sources.extend(path for path in sys.path if path)
+    return [path for i, path in enumerate(sources) if os.path.isdir(path) and path not in sources[:i]]
+
+def _source_mtimes(source):
+    """Modification times that change when distributions are installed into or removed from source.
+
+    Scoped npm packages live one level down in node_modules/@scope, whose
+    changes don't touch the node_modules directory itself.
+    """
+    mtimes = [os.stat(source).st_mtime]
+    if os.path.basename(source) == 'node_modules':
+        with os.scandir(source) as entries:
+            mtimes.extend(entry.stat().st_mtime for entry in sorted(entries, key=lambda entry: entry.name)
+                          if entry.name.startswith('@') and entry.is_dir())
+    return mtimes
+
+def load_dist_index(sources):
+    """Load the persistent distribution index, rescanning only directories that changed.
+
+    Returns a mapping of source directory to {normalized name: metadata}.
+    """
+    index_path = os.path.join(get_cache_dir(), 'dist-index.json')
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+
+    changed = False
+    lookup = {}
+    for source in sources:
+        try:
+            mtime = _source_mtimes(source)
+        except OSError:
+            continue
+        cached = index.get(source)
+        # Installing or removing a distribution touches the directory mtimes
+        if not cached or cached.get('mtime') != mtime:
+            scan = _scan_node_modules if os.path.basename(source) == 'node_modules' else _scan_site_packages
+            cached = {'mtime': mtime, 'dists': scan(source, (cached or {}).get('dists', {}))}
+            index[source] = cached
+            changed = True
+        lookup[source] = {normalize_dep_name(dist['name']): dist for dist in cached['dists'].values()}
+
+    if changed:
+        try:
+            _save_json_cache(index_path, index)
+        except OSError:
+            pass
+    return lookup
+
+def resolve_dependency_metadata(dependencies, sources, index):
+    """Find version, license and summary of each dependency among installed distributions"""
+    metadata = {}
+    for dep in dependencies:
+        key = normalize_dep_name(dep)
+        for source in sources:
+            dist = index.get(source, {}).get(key)
+            if dist:
+                metadata[dep] = {'version': dist['version'], 'license': dist['license'], 'summary': dist['summary']}
+                break
+    return metadata
+
+# Project licenses that cannot take in strong copyleft dependencies
+PERMISSIVE_LICENSES = ['MIT', 'Apache-2.0', 'BSD-3-Clause']
+
+def license_conflicts(project_license, dependency_license):
+    """Check whether a dependency's license is likely incompatible with the project license"""
+    dependency_license = (dependency_license or '').upper()
+    if not dependency_license or project_license == 'NONE':
+        return False
+    # LGPL allows linking from permissively licensed code
+    copyleft = re.search(r'(?<!L)GPL|GENERAL PUBLIC LICENSE', dependency_license) and 'LESSER' not in dependency_license
+    if project_license in PERMISSIVE_LICENSES:
+        return bool(copyleft)
+    if project_license == 'GPL':
+        return bool(re.search(r'GPL-?2\.0-ONLY|GPLV2 ONLY', dependency_license))
+    return False
+
+def _read_manifest(open_file, name):
+    """Read a small manifest file, returning None when it does not exist"""
+    f = open_file(name)
+    if f is None:
+        return None
+    with f:
+        return f.read()
+
+def _exists(open_file, name):
+    """Check that a file exists without reading it"""
+    f = open_file(name)
+    if f is None:
+        return False
+    f.close()
+    return True
+
+def _literal(node):
+    """Evaluate a literal AST node, or return None for anything computed at runtime"""
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+# Calls that create something later calls are made on, mapped to what they create
+PARSER_FACTORIES = {
+    'ArgumentParser': 'parser',
+    'add_parser': 'parser',
+    'add_subparsers': 'subparsers',
+    'add_argument_group': 'group',
+    'add_mutually_exclusive_group': 'group',
+}
+
+def _dotted_name(node):
+    """Name a variable or attribute chain such as parser or self.parser, or None for other expressions"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted_name(node.value)
+        return f'{base}.{node.attr}' if base else None
+    return None
+
+def _analyze_cli_source(source):
+    """Extract argparse descriptions and add_argument options from Python source.
+
+    Parsers are tracked through the variables they are assigned to, so options
+    added to subcommand parsers are reported per subcommand, and options of
+    parent parsers are inherited by the parsers listing them in parents=[...].
+    """
+    tree = ast.parse(source)
+    targets = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Call):
+            target = node.targets[0] if isinstance(node, ast.Assign) else node.target
+            targets[id(node.value)] = _dotted_name(target)
+
+    parsers = []
+    variables = {}
+    # Options added through helpers taking the parser as an argument go to the main parser
+    unattached = []
+    calls = sorted((node for node in ast.walk(tree) if isinstance(node, ast.Call)), key=lambda node: (node.lineno, node.col_offset))
+    for call in calls:
+        func = call.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        receiver = variables.get(_dotted_name(func.value)) if isinstance(func, ast.Attribute) else None
+        keywords = {kw.arg: _literal(kw.value) for kw in call.keywords if kw.arg}
+        created = None
+
+        if name == 'ArgumentParser' or (name == 'add_parser' and receiver and receiver[0] == 'subparsers'):
+            parent = parsers[receiver[1]]['name'] if name == 'add_parser' else None
+            command = _literal(call.args[0]) if name == 'add_parser' and call.args else None
+            if name == 'add_parser' and not isinstance(command, str):
+                continue
+            parents = next((kw.value for kw in call.keywords if kw.arg == 'parents'), None)
+            description = keywords.get('description') or keywords.get('help')
+            parsers.append({
+                'name': f'{parent} {command}' if parent and command else command,
+                'description': description if isinstance(description, str) else None,
+                'options': [],
+                'parents': [_dotted_name(element) for element in getattr(parents, 'elts', [])],
+                'is_subcommand': name == 'add_parser',
+            })
+            created = ('parser', len(parsers) - 1)
+        elif name in PARSER_FACTORIES and receiver and receiver[0] != 'subparsers':
+            created = (PARSER_FACTORIES[name], receiver[1])
+        elif name == 'add_argument':
+            flags = [flag for flag in map(_literal, call.args) if isinstance(flag, str)]
+            if not flags:
+                continue
+            options = unattached if receiver is None or receiver[0] == 'subparsers' else parsers[receiver[1]]['options']
+            options.append({
+                'flags': flags,
+                'help': keywords.get('help') or '',
+                'default': keywords.get('default'),
+                'action': keywords.get('action'),
+                'metavar': keywords.get('metavar'),
+                'choices': keywords.get('choices'),
+                'required': bool(keywords.get('required')),
+            })
+
+        if created and targets.get(id(call)):
+            variables[targets[id(call)]] = created
+
+    # Parent parsers only contribute their options to the parsers that list them
+    parent_parsers = set()
+    for parser in parsers:
+        inherited = []
+        for key in parser['parents']:
+            if key in variables and variables[key][0] == 'parser':
+                parent_parsers.add(variables[key][1])
+                inherited.extend(parsers[variables[key][1]]['options'])
+        parser['options'] = inherited + parser['options']
+
+    main_parser = next((parser for i, parser in enumerate(parsers) if not parser['is_subcommand'] and i not in parent_parsers), None)
+    return {
+        'description': main_parser['description'] if main_parser else None,
+        'options': (main_parser['options'] if main_parser else []) + unattached,
+        'subcommands': [{'name': parser['name'], 'description': parser['description'], 'options': parser['options']}
+                        for parser in parsers if parser['is_subcommand']],
+    }
+
+CLI_ANALYSIS_VERSION = 2
+
+def analyze_cli_sources(sources):
+    """Statically analyze CLI modules without importing them, cached by content hash"""
+    cache_path = os.path.join(get_cache_dir(), 'ast-cache.json')
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    results = []
+    changed = False
+    for source in sources:
+        # Versioned so analyses cached in an older layout are not reused
+        key = hashlib.sha256(f'{CLI_ANALYSIS_VERSION}:{source}'.encode('utf-8')).hexdigest()
+        if key not in cache:
+            try:
+                cache[key] = _analyze_cli_source(source)
+            except (SyntaxError, ValueError):
+                cache[key] = {'description': None, 'options': [], 'subcommands': []}
+            changed = True
+        results.append(cache[key])
+
+    if changed:
+        # Keep the cache bounded; the oldest entries are dropped first
+        cache = dict(list(cache.items())[-1000:])
+        try:
+            _save_json_cache(cache_path, cache)
+        except OSError:
+            pass
+    return results
+
+def _format_command(command, analysis):
+    """Turn an analyzed CLI into a usage line and an options table"""
+    positionals = []
+    options = []
+    for option in analysis['options']:
+        default = option['default']
+        help_text = option['help'].replace('%(default)s', str(default)).replace('%%', '%').replace('|', '\\|')
+        if option['choices']:
+            help_text = f"{help_text} (choices: {', '.join(map(str, option['choices']))})".strip()
+        if not option['flags'][0].startswith('-'):
+            positionals.append(f"<{option['metavar'] or option['flags'][0]}>")
+            continue
+        options.append({
+            'flags': option['flags'],
+            'help': help_text,
+            'default': '' if default in (None, False) or option['action'] in ('store_true', 'store_false') else str(default),
+        })
+    subcommands = [_format_command(f"{command} {subcommand['name']}", subcommand) for subcommand in analysis.get('subcommands', [])]
+    usage = ' '.join([command] + (['[options]'] if options else []) + positionals + (['[command]'] if subcommands else []))
+    return {'name': command, 'description': analysis['description'], 'usage': usage, 'options': options, 'subcommands': subcommands}
+
+def scan_project(open_file):
+    """Derive install steps, CLI usage and contributing hints from project files"""
+    package_json = _read_manifest(open_file, 'package.json')
+    package_data = json.loads(package_json) if package_json else {}
+    pyproject_text = _read_manifest(open_file, 'pyproject.toml')
+    pyproject = {}
+    if pyproject_text and tomllib is not None:
+        try:
+            pyproject = tomllib.loads(pyproject_text)
+        except ValueError:
+            pass
+    setup_cfg = configparser.ConfigParser(interpolation=None)
+    setup_cfg_text = _read_manifest(open_file, 'setup.cfg')
+    if setup_cfg_text:
+        try:
+            setup_cfg.read_string(setup_cfg_text)
+        except configparser.Error:
+            pass
+    has_setup_py = _exists(open_file, 'setup.py')
+    has_requirements = _exists(open_file, 'requirements.txt')
+    has_cargo = _exists(open_file, 'Cargo.toml')
+
+    # Installation
+    install_steps = []
+    if has_requirements:
+        install_steps.append('pip install -r requirements.txt')
+    if pyproject_text is not None or has_setup_py:
+        install_steps.append('pip install .')
+    if package_json:
+        if _exists(open_file, 'pnpm-lock.yaml'):
+            install_steps.append('pnpm install')
+        elif _exists(open_file, 'yarn.lock'):
+            install_steps.append('yarn install')
+        else:
+            install_steps.append('npm install')
+    if has_cargo:
+        install_steps.append('cargo build --release')
+
+    # Console scripts and their entry-point modules
+    entry_points = {}
+    scripts = dict(pyproject.get('tool', {}).get('poetry', {}).get('scripts', {}))
+    scripts.update(pyproject.get('project', {}).get('scripts', {}))
+    if setup_cfg.has_option('options.entry_points', 'console_scripts'):
+        for line in setup_cfg.get('options.entry_points', 'console_scripts').splitlines():
+            name, _, target = line.partition('=')
+            if target.strip():
+                scripts.setdefault(name.strip(), target.strip())
+    for name, target in scripts.items():
+        if isinstance(target, str):
+            module = target.split(':')[0].strip().replace('.', '/')
+            entry_points[name] = [f'{module}.py', f'{module}/__init__.py', f'src/{module}.py', f'src/{module}/__init__.py']
+
+    bin_entries = package_data.get('bin') or {}
+    if isinstance(bin_entries, str):
+        bin_entries = {package_data.get('name', '').split('/')[-1]: bin_entries}
+    for name in bin_entries:
+        entry_points.setdefault(name, [])
+
+    # Plain scripts such as this tool's own main.py
+    if not entry_points:
+        for script in ('main.py', 'cli.py'):
+            source = _read_manifest(open_file, script)
+            if source and 'add_argument' in source:
+                entry_points[f'python {script}'] = [script]
+                break
+
+    commands = []
+    sources = []
+    for name, candidates in entry_points.items():
+        source = next((text for text in map(lambda path: _read_manifest(open_file, path), candidates) if text is not None), None)
+        commands.append(name)
+        sources.append(source or '')
+    analyses = analyze_cli_sources(sources)
+    commands = [_format_command(name, analysis) for name, analysis in zip(commands, analyses)]
+
+    # Contributing
+    test_command = None
+    if (package_data.get('scripts') or {}).get('test'):
+        test_command = 'npm test'
+    elif has_cargo:
+        test_command = 'cargo test'
+    elif 'pytest' in pyproject.get('tool', {}) or _exists(open_file, 'pytest.ini') or _exists(open_file, 'tox.ini'):
+        test_command = 'python -m pytest'
+    guide = next((name for name in ('CONTRIBUTING.md', '.github/CONTRIBUTING.md', 'docs/CONTRIBUTING.md')
+                  if _exists(open_file, name)), None)
+
+    return {
+        'install_steps': install_steps,
+        'commands': commands,
+        'contributing': {'guide': guide, 'test_command': test_command},
+    }
+
+def get_manifest_opener(repo, rev=None):
+    """Pick where manifests are read from: the working tree, or git objects at a revision"""
+    if rev or repo.bare:
+        return tree_opener(repo.commit(rev or 'HEAD').tree)
+    return worktree_opener(repo.working_tree_dir)
+
+def scan_dependencies(open_file, lock_open_file=None):
+    """Extract dependencies and their locked versions from common manifest files"""
+    dependencies = []
+    ranges = {}
+    root_names = []
+
+    f = open_file('requirements.txt')
+    if f is not None:
+        with f:
+            dependencies = [line.strip().split('==')[0] for line in f if line.strip() and not line.startswith('#')]
+
+    # PEP 621 and Poetry projects declare their dependencies in pyproject.toml
+    pyproject_text = _read_manifest(open_file, 'pyproject.toml')
+    pyproject = {}
+    if pyproject_text and tomllib is not None:
+        try:
+            pyproject = tomllib.loads(pyproject_text)
+        except ValueError:
+            pass
+    root_names.append(pyproject.get('project', {}).get('name'))
+    root_names.append(pyproject.get('tool', {}).get('poetry', {}).get('name'))
+    if not dependencies:
+        for spec in pyproject.get('project', {}).get('dependencies', []):
+            match = re.match(r'[A-Za-z0-9][A-Za-z0-9._-]*', spec.strip())
+            if match:
+                dependencies.append(match.group(0))
+        if not dependencies:
+            poetry_dependencies = pyproject.get('tool', {}).get('poetry', {}).get('dependencies', {})
+            dependencies = [name for name in poetry_dependencies if name.lower() != 'python']
+
+    cargo_text = _read_manifest(open_file, 'Cargo.toml')
+    cargo = {}
+    if cargo_text and tomllib is not None:
+        try:
+            cargo = tomllib.loads(cargo_text)
+        except ValueError:
+            pass
+    root_names.append(cargo.get('package', {}).get('name'))
+    if not dependencies:
+        # Renamed dependencies are locked under their real package name
+        dependencies = [spec.get('package', name) if isinstance(spec, dict) else name
+                        for name, spec in cargo.get('dependencies', {}).items()]
+
+    f = open_file('package.json')
+    if f is not None:
+        with f:
+            package_data = json.load(f)
+            if 'dependencies' in package_data:
+                dependencies = list(package_data['dependencies'].keys())
+                ranges = package_data['dependencies']
+
+    dependencies = dependencies[:10]  # Limit to 10 dependencies
+
+    return {
+        'dependencies': dependencies,
+        'dependency_versions': get_locked_versions(dependencies, lock_open_file or open_file, ranges, root_names),
+    }
+
+# Probes run with their own git.Repo, since GitPython objects are not shared safely between threads
+def _probe_remote(repo_path, rev=None):
+    """Read the origin remote URL"""
+    repo = git.Repo(repo_path)
+    origin = next((remote for remote in repo.remotes if remote.name == 'origin'), None)
+    return {'remote_url': origin.url if origin else None}
+
+def _probe_last_commit(repo_path, rev=None):
+    """Read the subject and date of the last commit"""
+    repo = git.Repo(repo_path)
+    if not rev and not repo.heads:
+        return {}
+    commit = repo.commit(rev or 'HEAD')
+    return {
+        'last_commit': commit.message.split('\n')[0][:50],
+        'last_commit_date': commit.committed_datetime.strftime('%Y-%m-%d'),
+    }
+
+def _probe_dependencies(repo_path, rev=None):
+    """Scan dependencies, locked versions and installed distribution metadata"""
+    repo = git.Repo(repo_path)
+    data = scan_dependencies(get_manifest_opener(repo, rev))
+
+    # Installed distributions only describe a checked-out working tree
+    data['dependency_metadata'] = {}
+    if not (rev or repo.bare):
+        sources = get_dist_sources(repo.working_tree_dir)
+        data['dependency_metadata'] = resolve_dependency_metadata(data['dependencies'], sources, load_dist_index(sources))
+    return data
+
+def _probe_project(repo_path, rev=None):
+    """Derive install steps, usage and contributing hints"""
+    return scan_project(get_manifest_opener(git.Repo(repo_path), rev))
+
+# Independent repository probes and their deadlines in seconds
+REPO_PROBES = {
+    'remote': _probe_remote,
+    'last_commit': _probe_last_commit,
+    'dependencies': _probe_dependencies,
+    'project': _probe_project,
+}
+PROBE_TIMEOUTS = {
+    'remote': 5.0,
+    'last_commit': 10.0,
+    'dependencies': 30.0,
+    'project': 30.0,
+}
+
+def run_probes(probes, timeouts):
+    """Run probes concurrently and merge results as they arrive, each against its own deadline.
+
+    Returns the merged data, a reason for every probe that failed or timed out,
+    and how long each finished probe took.
+    """
+    results = queue.Queue()
+
+    def run(name, probe):
+        started = time.monotonic()
+        try:
+            results.put((name, probe(), None, time.monotonic() - started))
+        except Exception as e:
+            results.put((name, None, e, time.monotonic() - started))
+
+    # Daemon threads, so a probe stuck on NFS or a credential prompt never blocks exit
+    start = time.monotonic()
+    for name, probe in probes.items():
+        threading.Thread(target=run, args=(name, probe), name=f'probe-{name}', daemon=True).start()
+
+    deadlines = {name: start + timeouts[name] for name in probes}
+    pending = set(probes)
+    data = {}
+    failures = {}
+    timings = {}
+    while pending:
+        try:
+            name, value, error, elapsed = results.get(timeout=max(0, min(deadlines[n] for n in pending) - time.monotonic()))
+        except queue.Empty:
+            now = time.monotonic()
+            for name in [n for n in pending if deadlines[n] <= now]:
+                pending.discard(name)
+                failures[name] = f'timed out after {timeouts[name]:g}s'
+            continue
+        if name not in pending:
+            continue
+        pending.discard(name)
+        timings[name] = round(elapsed, 3)
+        if error is not None:
+            failures[name] = f'{type(error).__name__}: {error}'
+        else:
+            data.update(value or {})
+
+    return data, failures, timings
+
+def clone_steps(remote_url):
+    """Commands to fetch the project before installing it"""
+    directory = remote_url.rstrip('/').split('/')[-1].split(':')[-1]
+    if directory.endswith('.git'):
+        directory = directory[:-len('.git')]
+    return [f'git clone {remote_url}', f'cd {directory}']
+
+def get_repo_data(repo_path='.', rev=None, timeout=None, probes=None):
+    """Extract repository information from git.
+
+    Bare repositories, or any repository when ``rev`` is given, are read
+    directly from the object database at that revision without a checkout.
+    Probes run concurrently; any that fail or miss their deadline are reported
+    and simply leave their fields empty.
+    """
+    repo_data = {
+        'remote_url': None,
+        'last_commit': None,
+        'last_commit_date': None,
+        'dependencies': [],
+        'dependency_versions': {},
+        'dependency_metadata': {},
+        'install_steps': [],
+        'commands': [],
+        'contributing': {'guide': None, 'test_command': None},
+    }
+
+    probes = {name: partial(REPO_PROBES[name], repo_path, rev) for name in (probes or REPO_PROBES)}
+    timeouts = {name: timeout or PROBE_TIMEOUTS[name] for name in probes}
+    data, failures, timings = run_probes(probes, timeouts)
+    repo_data.update(data)
+
+    if repo_data['remote_url'] and repo_data['install_steps']:
+        repo_data['install_steps'] = clone_steps(repo_data['remote_url']) + repo_data['install_steps']
+
+    for name, reason in failures.items():
+        print(f"⚠️  Repository probe '{name}' skipped: {reason}")
+    repo_data['probe_failures'] = failures
+    repo_data['probe_timings'] = timings
+    return repo_data
+
+# Files marking a directory as a workspace package
+PACKAGE_MANIFESTS = ['package.json', 'pyproject.toml', 'Cargo.toml', 'setup.py', 'requirements.txt', '__init__.py']
+
+# Package locations tried when the workspace declares none
+DEFAULT_WORKSPACE_GLOBS = ['packages/*', 'apps/*', 'src/*']
+
+def _read_toml(path):
+    """Load a TOML file, or return an empty table when it is missing or unreadable"""
+    if tomllib is None or not os.path.isfile(path):
+        return {}
+    try:
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _read_pnpm_workspace(path):
+    """Read the packages list from pnpm-workspace.yaml"""
+    patterns = []
+    in_packages = False
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if not line[0].isspace():
+                in_packages = stripped == 'packages:'
+            elif in_packages and stripped.startswith('-'):
+                patterns.append(stripped[1:].strip().strip('\'"'))
+    return patterns
+
+def get_workspace_globs(root):
+    """Collect package globs from npm/pnpm, Cargo, uv and poetry workspace definitions"""
+    patterns = []
+
+    path = os.path.join(root, 'package.json')
+    if os.path.isfile(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            workspaces = json.load(f).get('workspaces', [])
+        if isinstance(workspaces, dict):
+            workspaces = workspaces.get('packages', [])
+        patterns.extend(workspaces)
+
+    path = os.path.join(root, 'pnpm-workspace.yaml')
+    if os.path.isfile(path):
+        patterns.extend(_read_pnpm_workspace(path))
+
+    cargo = _read_toml(os.path.join(root, 'Cargo.toml')).get('workspace', {})
+    patterns.extend(cargo.get('members', []))
+    patterns.extend('!' + pattern for pattern in cargo.get('exclude', []))
+
+    pyproject = _read_toml(os.path.join(root, 'pyproject.toml'))
+    uv = pyproject.get('tool', {}).get('uv', {}).get('workspace', {})
+    patterns.extend(uv.get('members', []))
+    patterns.extend('!' + pattern for pattern in uv.get('exclude', []))
+
+    # Poetry has no workspace table, so monorepos link their packages as path dependencies
+    poetry = pyproject.get('tool', {}).get('poetry', {})
+    for spec in poetry.get('dependencies', {}).values():
+        if isinstance(spec, dict) and 'path' in spec:
+            patterns.append(spec['path'])
+
+    return patterns
+
+def _read_gitignore(root):
+    """Read simple ignore rules from the top-level .gitignore"""
+    rules = []
+    path = os.path.join(root, '.gitignore')
+    if os.path.isfile(path):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith(('#', '!')):
+                    continue
+                # Patterns containing a slash are relative to the root, others match any name
+                rules.append((line.strip('/'), '/' in line.rstrip('/')))
+    return rules
+
+def _split_glob(pattern):
+    """Split a workspace glob into path segments"""
+    if pattern.startswith('./'):
+        pattern = pattern[2:]
+    return pattern.strip('/').split('/')
+
+def _glob_match(parts, pattern_parts):
+    """Match path segments against glob segments, where ** spans any number of them"""
+    if not pattern_parts:
+        return not parts
+    if pattern_parts[0] == '**':
+        return any(_glob_match(parts[i:], pattern_parts[1:]) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatch.fnmatchcase(parts[0], pattern_parts[0]) and _glob_match(parts[1:], pattern_parts[1:])
+
+def discover_workspace_packages(root, globs=None):
+    """Find workspace package directories with a gitignore-aware scandir walk"""
+    globs = globs or get_workspace_globs(root) or DEFAULT_WORKSPACE_GLOBS
+    globs = [pattern.strip() for pattern in globs]
+    includes = [_split_glob(pattern) for pattern in globs if not pattern.startswith('!')]
+    excludes = [_split_glob(pattern[1:]) for pattern in globs if pattern.startswith('!')]
+    ignore_rules = _read_gitignore(root)
+
+    # Only descend as deep as the deepest pattern needs
+    max_depth = None if any('**' in parts for parts in includes) else max((len(parts) for parts in includes), default=0)
+
+    packages = []
+    stack = [('', 0)]
+    while stack:
+        rel, depth = stack.pop()
+        with os.scandir(os.path.join(root, rel)) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False) or entry.name in ('.git', 'node_modules'):
+                    continue
+                child = f'{rel}/{entry.name}' if rel else entry.name
+                if any(fnmatch.fnmatchcase(child if anchored else entry.name, pattern) for pattern, anchored in ignore_rules):
+                    continue
+                parts = child.split('/')
+                if (any(_glob_match(parts, pattern) for pattern in includes)
+                        and not any(_glob_match(parts, pattern) for pattern in excludes)
+                        and any(os.path.exists(os.path.join(entry.path, name)) for name in PACKAGE_MANIFESTS)):
+                    packages.append(child)
+                if max_depth is None or depth + 1 < max_depth:
+                    stack.append((child, depth + 1))
+
+    return sorted(packages)
+
+def read_package_info(open_file):
+    """Read a package's name and description from its manifest"""
+    f = open_file('package.json')
+    if f is not None:
+        with f:
+            package_data = json.load(f)
+        return {'name': package_data.get('name'), 'description': package_data.get('description')}
+
+    for manifest, sections in (('pyproject.toml', ('project', 'tool.poetry')), ('Cargo.toml', ('package',))):
+        f = open_file(manifest)
+        if f is None or tomllib is None:
+            continue
+        with f:
+            try:
+                data = tomllib.loads(f.read())
+            except ValueError:
+                continue
+        for section in sections:
+            table = data
+            for key in section.split('.'):
+                table = table.get(key, {})
+            if table.get('name'):
+                return {'name': table['name'], 'description': table.get('description')}
+
+    return {'name': None, 'description': None}
 
 def get_user_input():
     """Get user input through interactive prompts"""
@@ -76,6 +1180,8 @@ def get_user_input():
     include_usage = inquirer.confirm(message="Include usage instructions?", default=True).execute()
     include_contributing = inquirer.confirm(message="Include contributing guidelines?", default=True).execute()
     include_fun_gifs = inquirer.confirm(message="Include fun GIFs section?", default=False).execute()
+    include_gallery = inquirer.confirm(message="Include screenshot gallery?", default=False).execute()
+    gallery_dir = inquirer.text(message="Screenshot directory", default="docs/screenshots").execute() if include_gallery else ''
 
     return {
         'name': name,
@@ -95,10 +1201,117 @@ def get_user_input():
         'include_usage': include_usage,
         'include_contributing': include_contributing,
         'include_fun_gifs': include_fun_gifs,
+        'include_gallery': include_gallery,
+        'gallery_dir': gallery_dir,
     }
 
-def create_license(license_type, author):
-    """Create a license file"""
+# How hard atomic writes push data to disk: not at all, the file, or the file and its directory
+FSYNC_POLICIES = ['none', 'file', 'full']
+
+def _fsync_dir(path):
+    """Flush a directory entry so a rename survives a crash (no-op where unsupported)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def atomic_write(path, content, fsync='file'):
+    """Write a file through a temporary file and rename, so readers never see it half-written"""
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix='.tmp-', delete=False) as f:
+        f.write(content)
+        f.flush()
+        if fsync != 'none':
+            os.fsync(f.fileno())
+    if os.path.exists(path):
+        shutil.copymode(path, f.name)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(f.name, 0o666 & ~umask)
+    os.replace(f.name, path)
+    if fsync == 'full':
+        _fsync_dir(directory)
+
+def _lock_file(f, blocking):
+    """Take an exclusive advisory lock on an open file, returning False if it is busy"""
+    if fcntl is not None:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            return True
+        except BlockingIOError:
+            return False
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(0.1)
+
+def _unlock_file(f):
+    """Release a lock taken with _lock_file"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def generation_lock(output_path):
+    """Hold a per-repository advisory lock while generating into output_path's directory.
+
+    The lock lives in the repository's git directory, keyed by the output
+    directory relative to the working tree, so runs from other users,
+    containers or mount points of the same checkout exclude each other too.
+    Outside a git repository it is kept in the cache directory, keyed by the
+    absolute output directory. Yields the path of the render stamp kept next
+    to the lock, and whether another run was holding the lock when this one arrived.
+    """
+    output_dir = os.path.realpath(os.path.dirname(os.path.abspath(output_path)))
+    os.makedirs(output_dir, exist_ok=True)
+    try:
+        repo = git.Repo(output_dir, search_parent_directories=True)
+        lock_dir = os.path.join(repo.git_dir, 'readme-generator')
+        lock_id = os.path.relpath(output_dir, os.path.realpath(repo.working_tree_dir or repo.git_dir)).replace(os.sep, '/')
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        lock_dir = os.path.join(get_cache_dir(), 'locks')
+        lock_id = output_dir
+    key = hashlib.sha256(lock_id.encode('utf-8')).hexdigest()[:16]
+    os.makedirs(lock_dir, exist_ok=True)
+    lock_path = os.path.join(lock_dir, f'{key}.lock')
+
+    with open(lock_path, 'a+') as f:
+        waited = not _lock_file(f, blocking=False)
+        if waited:
+            print(f"⏳ Waiting for another run generating {output_path}")
+            _lock_file(f, blocking=True)
+        try:
+            yield os.path.join(lock_dir, f'{key}.json'), waited
+        finally:
+            _unlock_file(f)
+
+def _render_key(user_input, repo_data, output_path, merge):
+    """Fingerprint everything a render depends on, ignoring run-specific probe details"""
+    inputs = {key: value for key, value in repo_data.items() if key not in ('probe_failures', 'probe_timings')}
+    payload = json.dumps([user_input, inputs, os.path.abspath(output_path), merge], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _reusable_render(stamp_path, render_key, output_path):
+    """Check whether the last finished render had the same inputs and its output is intact"""
+    try:
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            stamp = json.load(f)
+        return stamp.get('key') == render_key and 'result' in stamp and stamp.get('output_hash') == _file_digest(output_path)
+    except (OSError, ValueError):
+        return False
+
+def create_license(license_type, author, fsync='file', output_dir='.'):
+    """Create a license file in output_dir"""
     licenses = {
         'MIT': f'''MIT License
 
@@ -197,13 +1410,244 @@ For the full GPL-3.0 license text, please visit: https://www.gnu.org/licenses/gp
     }
 
     if license_type in licenses:
-        with open('LICENSE', 'w') as f:
-            f.write(licenses[license_type])
+        atomic_write(os.path.join(output_dir, 'LICENSE'), licenses[license_type], fsync)
         print(f"📄 Created {license_type} license file")
         return True
     return False
 
-def generate_readme(user_input, repo_data, output_path):
+# Screenshot formats picked up for the gallery
+GALLERY_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+# Thumbnails live next to the screenshots so the README can link them
+THUMBNAIL_DIR = 'thumbnails'
+
+def _file_digest(path):
+    """Hash a file's content without reading it into memory at once"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _make_thumbnail(source, target, size):
+    """Resize and recompress one image; runs in a worker process"""
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((size, size))
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        temp_path = target + '.tmp'
+        image.save(temp_path, 'WEBP', quality=80, method=6)
+    os.replace(temp_path, target)
+    return target
+
+def build_gallery(gallery_dir, output_dir, size=400):
+    """Collect gallery images and make thumbnails for any that changed.
+
+    Thumbnails are named after the source content hash, so unchanged images are
+    never reprocessed and new ones are resized in a process pool.
+    """
+    image_dir = os.path.join(output_dir, gallery_dir)
+    if not os.path.isdir(image_dir):
+        print(f"⚠️  Gallery directory {gallery_dir} not found")
+        return []
+
+    with os.scandir(image_dir) as entries:
+        images = sorted(entry.path for entry in entries if entry.is_file() and entry.name.lower().endswith(GALLERY_EXTENSIONS))
+
+    thumb_dir = os.path.join(image_dir, THUMBNAIL_DIR)
+    gallery = []
+    pending = []
+    for path in images:
+        item = {
+            'title': re.sub(r'[-_]+', ' ', os.path.splitext(os.path.basename(path))[0]).strip().capitalize(),
+            'image': os.path.relpath(path, output_dir).replace(os.sep, '/'),
+            'thumbnail': None,
+        }
+        if Image is not None:
+            thumbnail = os.path.join(thumb_dir, f'{_file_digest(path)[:16]}-{size}.webp')
+            item['thumbnail'] = os.path.relpath(thumbnail, output_dir).replace(os.sep, '/')
+            if not os.path.exists(thumbnail):
+                pending.append((path, thumbnail))
+        gallery.append(item)
+
+    if Image is None:
+        print("⚠️  Pillow is not installed, linking full-size screenshots without thumbnails")
+        return gallery
+
+    os.makedirs(thumb_dir, exist_ok=True)
+    if pending:
+        with ProcessPoolExecutor() as pool:
+            futures = [pool.submit(_make_thumbnail, path, thumbnail, size) for path, thumbnail in pending]
+            for (path, _), future in zip(pending, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"⚠️  Could not make a thumbnail for {path}: {e}")
+        print(f"🖼️  Created {len(pending)} thumbnail(s) in {os.path.relpath(thumb_dir)}")
+
+    # Drop thumbnails of screenshots that were changed or removed
+    current = {os.path.basename(item['thumbnail']) for item in gallery}
+    with os.scandir(thumb_dir) as entries:
+        for entry in entries:
+            if re.fullmatch(r'[0-9a-f]{16}-\d+\.webp', entry.name) and entry.name not in current:
+                os.unlink(entry.path)
+
+    for item in gallery:
+        if not os.path.exists(os.path.join(output_dir, item['thumbnail'])):
+            item['thumbnail'] = None
+    return gallery
+
+# Markers delimiting generated regions, e.g. <!-- readme-generator:tech-stack:start -->
+REGION_MARKER = re.compile(r'<!-- readme-generator:([a-z0-9-]+):(start|end) -->')
+
+def split_regions(content):
+    """Collect the lines of each generated region in rendered README content"""
+    regions = {}
+    current = None
+    for line in content.splitlines(keepends=True):
+        match = REGION_MARKER.fullmatch(line.strip())
+        if match and match.group(2) == 'start':
+            current = match.group(1)
+            regions[current] = []
+        elif match and match.group(1) == current:
+            current = None
+        elif current:
+            regions[current].append(line if line.endswith('\n') else line + '\n')
+    return regions
+
+def merge_readme(content, output_path, fsync='file'):
+    """Splice regenerated regions into an existing README, leaving user content untouched.
+
+    The existing file is streamed line by line into a temporary file next to it,
+    which only replaces the original when at least one region changed. Regions
+    the existing file does not have yet are appended at its end.
+    """
+    regions = split_regions(content)
+    seen = set()
+    changed = False
+    complete = True
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+
+    with open(output_path, 'r', encoding='utf-8') as src, \
+            tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=output_dir, delete=False) as dst:
+        region = None
+        position = 0
+        line = '\n'
+        for line in src:
+            match = REGION_MARKER.fullmatch(line.strip())
+            if region is None:
+                dst.write(line)
+                if match and match.group(2) == 'start':
+                    seen.add(match.group(1))
+                if match and match.group(2) == 'start' and match.group(1) in regions:
+                    region = match.group(1)
+                    position = 0
+            elif match and match.group(1) == region and match.group(2) == 'end':
+                new_lines = regions[region]
+                if position != len(new_lines):
+                    changed = True
+                dst.writelines(new_lines)
+                dst.write(line)
+                region = None
+            else:
+                # Compare old region content as it streams past instead of buffering it
+                if position >= len(regions[region]) or regions[region][position] != line:
+                    changed = True
+                position += 1
+        if region is not None:
+            complete = False
+
+        missing = [name for name in regions if name not in seen]
+        if missing and complete:
+            changed = True
+            if not line.endswith('\n'):
+                dst.write('\n')
+            for name in missing:
+                dst.write(f'\n<!-- readme-generator:{name}:start -->\n')
+                dst.writelines(regions[name])
+                dst.write(f'<!-- readme-generator:{name}:end -->\n')
+        dst.flush()
+        if changed and complete and fsync != 'none':
+            os.fsync(dst.fileno())
+
+    if not complete:
+        os.unlink(dst.name)
+        print(f"⚠️  Region '{region}' in {output_path} has no end marker, leaving the file untouched")
+        return False
+    if not changed:
+        os.unlink(dst.name)
+        print(f"✅ {output_path} is already up to date")
+        return False
+
+    shutil.copymode(output_path, dst.name)
+    os.replace(dst.name, output_path)
+    if fsync == 'full':
+        _fsync_dir(output_dir)
+    print(f"🔀 Merged regenerated sections into {output_path}")
+    if missing:
+        print(f"⚠️  {output_path} had no {', '.join(missing)} section(s), appended them at the end")
+    return True
+
+def _existing_theme(output_path, themes):
+    """Find the theme an existing README was rendered with, from the color in its header region"""
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = re.search(r'[&?]color=([0-9A-Fa-f]{6})', line)
+                if match:
+                    return next((theme for theme in themes if theme['color'] == match.group(1).upper()), None)
+                if line.strip() == '<!-- readme-generator:header:end -->':
+                    break
+    except OSError:
+        pass
+    return None
+
+def write_readme(content, output_path, merge=False, fsync='file'):
+    """Atomically write rendered README content, or merge it into an existing file.
+
+    Returns whether the README was written.
+    """
+    content = content.strip() + '\n'
+    if merge and os.path.exists(output_path):
+        return merge_readme(content, output_path, fsync)
+
+    atomic_write(output_path, content, fsync)
+    print(f"🎉 Beautiful README generated at {output_path}")
+    return True
+
+def generate_readme(user_input, repo_data, output_path, merge=False, write_license=True, fsync='file'):
+    """Render and write the README (and LICENSE) under a per-repository lock.
+
+    A run that had to wait for a concurrent one with identical inputs reuses
+    its output instead of rendering again. Returns what was written, for the catalog.
+    """
+    render_key = _render_key(user_input, repo_data, output_path, merge)
+    with generation_lock(output_path) as (stamp_path, waited):
+        if waited and _reusable_render(stamp_path, render_key, output_path):
+            print(f"♻️  {output_path} was just generated by a concurrent run with the same inputs, reusing it")
+            with open(stamp_path, 'r', encoding='utf-8') as f:
+                return json.load(f)['result']
+
+        started = time.monotonic()
+        content, theme = render_readme(user_input, repo_data, output_path, merge)
+        written = write_readme(content, output_path, merge, fsync)
+
+        # Create license file if requested, leaving it alone when the README was not touched
+        if written and write_license and user_input.get('license') != 'NONE':
+            create_license(user_input['license'], user_input['author'], fsync, os.path.dirname(os.path.abspath(output_path)))
+
+        result = {
+            'output_path': os.path.abspath(output_path),
+            'output_hash': _file_digest(output_path),
+            'theme': theme['style'],
+            'render_seconds': round(time.monotonic() - started, 3),
+        }
+        _save_json_cache(stamp_path, {'key': render_key, 'output_hash': result['output_hash'], 'result': result})
+        return result
+
+def render_readme(user_input, repo_data, output_path, merge=False):
+    """Render README content from user input and repository data, returning it with the theme used"""
     import random
 
     # Random visual themes
@@ -217,9 +1661,15 @@ def generate_readme(user_input, repo_data, output_path):
         {'color': '00D4FF', 'emoji': '💫', 'style': 'cool'},
     ]
 
-    theme = random.choice(themes)
+    if merge:
+        # Keep the theme the existing README uses, so unchanged regions are not rewritten
+        seed = repo_data.get('remote_url') or os.path.abspath(output_path)
+        theme = _existing_theme(output_path, themes) or random.Random(seed).choice(themes)
+    else:
+        theme = random.choice(themes)
 
     template_str = '''
+<!-- readme-generator:header:start -->
 <div align="center">
 
 # {{ theme_emoji }} {{ name }} {{ theme_emoji }}
@@ -227,9 +1677,11 @@ def generate_readme(user_input, repo_data, output_path):
 <p align="center">
   <img src="https://readme-typing-svg.herokuapp.com?font=Fira+Code&size=32&duration=2800&pause=2000&color={{ theme_color }}&center=true&vCenter=true&width=940&lines={{ name | replace(' ', '+') }};{{ description | replace(' ', '+') if description else 'Awesome+Project' }};Built+with+❤️+by+{{ author | replace(' ', '+') if author else 'Developer' }}" alt="Typing SVG" />
 </p>
+<!-- readme-generator:header:end -->
 
 ---
 
+<!-- readme-generator:badges:start -->
 {%- if include_badges %}
 <p align="center">
   <img src="https://img.shields.io/badge/License-{{ license }}-blue.svg?style=for-the-badge&logo=license&logoColor=white" alt="License Badge"/>
@@ -241,7 +1693,9 @@ def generate_readme(user_input, repo_data, output_path):
   <img src="https://img.shields.io/badge/Version-1.0.0-green?style=for-the-badge&logo=version&logoColor=white" alt="Version"/>
 </p>
 {%- endif %}
+<!-- readme-generator:badges:end -->
 
+<!-- readme-generator:social:start -->
 {%- if include_social %}
 <p align="center">
   {%- if twitter %}<a href="https://twitter.com/{{ twitter }}"><img src="https://img.shields.io/badge/Twitter-1DA1F2?style=for-the-badge&logo=twitter&logoColor=white" alt="Twitter"/></a>{%- endif %}
@@ -252,9 +1706,11 @@ def generate_readme(user_input, repo_data, output_path):
   {%- if github %}<a href="https://github.com/{{ github }}"><img src="https://img.shields.io/badge/GitHub-100000?style=for-the-badge&logo=github&logoColor=white" alt="GitHub"/></a>{%- endif %}
 </p>
 {%- endif %}
+<!-- readme-generator:social:end -->
 
 ---
 
+<!-- readme-generator:about:start -->
 ## 📖 About
 
 {{ description }}
@@ -263,9 +1719,87 @@ def generate_readme(user_input, repo_data, output_path):
 ### 🚀 Latest Update
 > *{{ repo_data.last_commit }}* - {{ repo_data.last_commit_date }}
 {%- endif %}
+<!-- readme-generator:about:end -->
 
 ---
 
+<!-- readme-generator:gallery:start -->
+{%- if gallery %}
+## 🖼️ Gallery
+
+<p align="center">
+{%- for item in gallery %}
+  <a href="{{ item.image }}"><img src="{{ item.thumbnail or item.image }}"{% if not item.thumbnail %} width="300"{% endif %} alt="{{ item.title }}" title="{{ item.title }}"/></a>
+{%- endfor %}
+</p>
+
+---
+{%- endif %}
+<!-- readme-generator:gallery:end -->
+
+<!-- readme-generator:install:start -->
+{%- if include_install and repo_data.install_steps %}
+## 📦 Installation
+
+```bash
+{%- for step in repo_data.install_steps %}
+{{ step }}
+{%- endfor %}
+```
+
+---
+{%- endif %}
+<!-- readme-generator:install:end -->
+
+<!-- readme-generator:usage:start -->
+{%- if include_usage and repo_data.commands %}
+## 💻 Usage
+{%- for command in repo_data.commands %}
+
+### `{{ command.name }}`
+{%- if command.description %}
+
+{{ command.description }}
+{%- endif %}
+
+```bash
+{{ command.usage }}
+```
+{%- if command.options %}
+
+| Option | Description | Default |
+|--------|-------------|---------|
+{%- for option in command.options %}
+| `{{ option.flags | join('`, `') }}` | {{ option.help }} | {{ option.default }} |
+{%- endfor %}
+{%- endif %}
+{%- for subcommand in command.subcommands %}
+
+#### `{{ subcommand.name }}`
+{%- if subcommand.description %}
+
+{{ subcommand.description }}
+{%- endif %}
+
+```bash
+{{ subcommand.usage }}
+```
+{%- if subcommand.options %}
+
+| Option | Description | Default |
+|--------|-------------|---------|
+{%- for option in subcommand.options %}
+| `{{ option.flags | join('`, `') }}` | {{ option.help }} | {{ option.default }} |
+{%- endfor %}
+{%- endif %}
+{%- endfor %}
+{%- endfor %}
+
+---
+{%- endif %}
+<!-- readme-generator:usage:end -->
+
+<!-- readme-generator:tech-stack:start -->
 ## 🛠️ Tech Stack
 
 {%- if repo_data.dependencies %}
@@ -273,43 +1807,92 @@ def generate_readme(user_input, repo_data, output_path):
 
 ### Dependencies
 {%- for dep in repo_data.dependencies %}
+{%- if repo_data.dependency_versions and repo_data.dependency_versions.get(dep) %}
+<img src="https://img.shields.io/badge/{{ dep | replace('-', '--') | replace('_', '__') }}-{{ repo_data.dependency_versions[dep] | replace('-', '--') | replace('_', '__') }}-{{ theme_color }}?style=for-the-badge&logo={{ dep | lower }}&logoColor=white" alt="{{ dep }} {{ repo_data.dependency_versions[dep] }}"/>
+{%- else %}
 <img src="https://img.shields.io/badge/{{ dep }}-{{ theme_color }}?style=for-the-badge&logo={{ dep | lower }}&logoColor=white" alt="{{ dep }}"/>
+{%- endif %}
 {%- endfor %}
 
 </div>
 {%- endif %}
 
+{%- if dependency_details %}
+
+### Dependency Details
+
+| Dependency | Version | License | Summary |
+|------------|---------|---------|---------|
+{%- for dep in dependency_details %}
+| {{ dep.name }} | {{ dep.version or '-' }} | {{ dep.license or 'Unknown' }}{% if dep.conflict %} ⚠️{% endif %} | {{ (dep.summary or '') | replace('|', '\\|') }} |
+{%- endfor %}
+
+{%- if dependency_details | selectattr('conflict') | list %}
+
+> ⚠️ **License check:** {{ dependency_details | selectattr('conflict') | map(attribute='name') | join(', ') }} may not be compatible with the {{ license }} license of this project.
+{%- endif %}
+{%- endif %}
+<!-- readme-generator:tech-stack:end -->
+
 ---
 
+<!-- readme-generator:stats:start -->
 ## 📊 Stats
 
 {%- if repo_data.remote_url %}
 <div align="center">
 
-<img src="https://github-readme-stats.vercel.app/api?username={{ repo_data.remote_url | replace('https://github.com/', '') | replace('.git', '') | split('/') | first }}&show_icons=true&theme=tokyonight&hide_border=true" alt="GitHub Stats" />
+<img src="https://github-readme-stats.vercel.app/api?username={{ (repo_data.remote_url | replace('https://github.com/', '') | replace('.git', '')).split('/')[0] }}&show_icons=true&theme=tokyonight&hide_border=true" alt="GitHub Stats" />
 
-<img src="https://github-readme-streak-stats.herokuapp.com/?user={{ repo_data.remote_url | replace('https://github.com/', '') | replace('.git', '') | split('/') | first }}&theme=tokyonight&hide_border=true" alt="GitHub Streak" />
+<img src="https://github-readme-streak-stats.herokuapp.com/?user={{ (repo_data.remote_url | replace('https://github.com/', '') | replace('.git', '')).split('/')[0] }}&theme=tokyonight&hide_border=true" alt="GitHub Streak" />
 
 </div>
 {%- endif %}
+<!-- readme-generator:stats:end -->
 
 ---
 
+<!-- readme-generator:contributing:start -->
+{%- if include_contributing %}
+## 🤝 Contributing
+
+Contributions are welcome!
+{%- if repo_data.contributing and repo_data.contributing.guide %} Please read [{{ repo_data.contributing.guide }}]({{ repo_data.contributing.guide }}) before opening a pull request.{%- endif %}
+
+1. Fork the repository
+2. Create a feature branch (`git checkout -b feature/amazing-feature`)
+{%- if repo_data.contributing and repo_data.contributing.test_command %}
+3. Make your changes and run the tests (`{{ repo_data.contributing.test_command }}`)
+{%- else %}
+3. Make your changes
+{%- endif %}
+4. Commit and push (`git commit -m 'Add amazing feature' && git push origin feature/amazing-feature`)
+5. Open a pull request
+
+---
+{%- endif %}
+<!-- readme-generator:contributing:end -->
+
+<!-- readme-generator:license:start -->
 ## 📄 License
 
 This project is licensed under the **{{ license }}** License - see the [LICENSE](LICENSE) file for details.
+<!-- readme-generator:license:end -->
 
 ---
 
+<!-- readme-generator:author:start -->
 ## 👨‍💻 Author
 
 **{{ author }}**
 {%- if email %}📧 {{ email }}{%- endif %}
 
 {%- if website %}🌐 [{{ website }}]({{ website }}){%- endif %}
+<!-- readme-generator:author:end -->
 
 ---
 
+<!-- readme-generator:fun:start -->
 {%- if include_fun_gifs %}
 ## 🎉 Fun Section
 
@@ -332,7 +1915,9 @@ This project is licensed under the **{{ license }}** License - see the [LICENSE]
 ---
 
 {%- endif %}
+<!-- readme-generator:fun:end -->
 
+<!-- readme-generator:footer:start -->
 <div align="center">
 
 **Made with ❤️ by {{ author }}**
@@ -344,8 +1929,24 @@ This project is licensed under the **{{ license }}** License - see the [LICENSE]
 *⭐ Star this repo if you found it helpful!*
 
 </div>
+<!-- readme-generator:footer:end -->
 '''
 
+    gallery = []
+    if user_input.get('include_gallery'):
+        gallery = build_gallery(user_input.get('gallery_dir') or 'docs/screenshots', os.path.dirname(os.path.abspath(output_path)))
+
+    # Combine lockfile versions with installed distribution metadata
+    dependency_details = []
+    for dep, metadata in (repo_data.get('dependency_metadata') or {}).items():
+        dependency_details.append({
+            'name': dep,
+            'version': (repo_data.get('dependency_versions') or {}).get(dep) or metadata['version'],
+            'license': metadata['license'],
+            'summary': metadata['summary'],
+            'conflict': license_conflicts(user_input['license'], metadata['license']),
+        })
+
     template = Template(template_str)
     content = template.render(
         name=user_input['name'],
@@ -367,30 +1968,334 @@ This project is licensed under the **{{ license }}** License - see the [LICENSE]
         include_fun_gifs=user_input.get('include_fun_gifs', False),
         theme_emoji=theme['emoji'],
         theme_color=theme['color'],
+        repo_data=repo_data,
+        dependency_details=dependency_details,
+        gallery=gallery
+    )
+
+    return content, theme
+
+def generate_workspace_index(user_input, repo_data, packages, output_path, merge=False, fsync='file'):
+    """Write a root README linking every workspace package"""
+    template_str = '''
+<!-- readme-generator:workspace-header:start -->
+<div align="center">
+
+# {{ name }}
+
+{{ description }}
+
+</div>
+<!-- readme-generator:workspace-header:end -->
+
+---
+
+<!-- readme-generator:packages:start -->
+## 📦 Packages
+
+| Package | Description | Tech Stack |
+|---------|-------------|------------|
+{%- for package in packages %}
+| [{{ package.name }}]({{ package.path }}/README.md) | {{ (package.description or '') | replace('|', '\\|') }} | {% for dep in package.dependencies %}`{{ dep }}{% if package.dependency_versions.get(dep) %}@{{ package.dependency_versions[dep] }}{% endif %}`{{ ', ' if not loop.last }}{% endfor %} |
+{%- endfor %}
+<!-- readme-generator:packages:end -->
+
+{%- if repo_data.last_commit %}
+
+---
+
+<!-- readme-generator:about:start -->
+### 🚀 Latest Update
+> *{{ repo_data.last_commit }}* - {{ repo_data.last_commit_date }}
+<!-- readme-generator:about:end -->
+{%- endif %}
+'''
+
+    template = Template(template_str)
+    content = template.render(
+        name=user_input['name'],
+        description=user_input['description'],
+        packages=packages,
         repo_data=repo_data
     )
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content.strip())
+    return write_readme(content, output_path, merge, fsync)
+
+def generate_workspace(user_input, repo_path, output_path, globs=None, merge=False, timeout=None, fsync='file', catalog=None):
+    """Generate a README per workspace package plus a root index, sharing one git probe"""
+    repo = git.Repo(repo_path)
+    if repo.bare:
+        print("❌ Workspace mode needs a working tree")
+        return
+
+    root = repo.working_tree_dir
+    root_open_file = worktree_opener(root)
+    # Probe git once and share the result with every package
+    git_data = get_repo_data(root, timeout=timeout, probes=['remote', 'last_commit'])
+    packages = discover_workspace_packages(root, globs)
+    if not packages:
+        print("❌ No workspace packages found")
+        return
+
+    def scan_package(path):
+        open_file = worktree_opener(os.path.join(root, path))
+        # Workspaces usually share a single lockfile at the root
+        lock_open_file = lambda name: open_file(name) or root_open_file(name)
+        package_data = dict(git_data)
+        # Like repository probes, one broken package only costs its own README
+        try:
+            package_data.update(scan_dependencies(open_file, lock_open_file))
+            package_data.update(scan_project(open_file))
+            info = read_package_info(open_file)
+        except Exception as e:
+            return path, None, f'{type(e).__name__}: {e}'
+        if package_data['remote_url'] and package_data['install_steps']:
+            package_data['install_steps'] = clone_steps(package_data['remote_url']) + package_data['install_steps']
+        return path, info, package_data
+
+    # Dependency scans only touch each package's own files, so they run in parallel
+    with ThreadPoolExecutor(max_workers=min(32, len(packages))) as pool:
+        results = []
+        for path, info, package_data in pool.map(scan_package, packages):
+            if info is None:
+                print(f"⚠️  Skipping workspace package {path}: {package_data}")
+            else:
+                results.append((path, info, package_data))
+
+    # Load the distribution index once for every package; hoisted installs live at the root
+    dist_index = load_dist_index(get_dist_sources(*[os.path.join(root, path) for path, _, _ in results], root))
+    for path, info, package_data in results:
+        sources = get_dist_sources(os.path.join(root, path), root)
+        package_data['dependency_metadata'] = resolve_dependency_metadata(package_data['dependencies'], sources, dist_index)
+
+    index_dir = os.path.dirname(os.path.abspath(output_path))
+    index = []
+    catalog_entries = []
+    for path, info, package_data in results:
+        package_input = dict(user_input)
+        package_input['name'] = info['name'] or os.path.basename(path)
+        package_input['description'] = info['description'] or user_input['description']
+        result = generate_readme(package_input, package_data, os.path.join(root, path, 'README.md'), merge=merge, write_license=False, fsync=fsync)
+        catalog_entries.append(catalog_entry(os.path.join(root, path), None, package_input, package_data, result))
+        index.append({
+            'name': package_input['name'],
+            'path': os.path.relpath(os.path.join(root, path), index_dir).replace(os.sep, '/'),
+            'description': info['description'],
+            'dependencies': package_data['dependencies'],
+            'dependency_versions': package_data['dependency_versions'],
+        })
+
+    with generation_lock(output_path):
+        written = generate_workspace_index(user_input, git_data, index, output_path, merge, fsync)
+
+        # Create license file if requested, leaving it alone when the index was not touched
+        if written and user_input.get('license') != 'NONE':
+            create_license(user_input['license'], user_input['author'], fsync, os.path.dirname(os.path.abspath(output_path)))
+
+    if catalog:
+        update_catalog(catalog, catalog_entries)
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    repo_path TEXT PRIMARY KEY,
+    rev TEXT,
+    name TEXT,
+    remote_url TEXT,
+    license TEXT,
+    theme TEXT,
+    output_path TEXT,
+    output_hash TEXT,
+    last_commit TEXT,
+    last_commit_date TEXT,
+    generated_at TEXT,
+    timings TEXT
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    repo_path TEXT NOT NULL REFERENCES repos(repo_path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    spec TEXT,
+    version TEXT,
+    license TEXT,
+    PRIMARY KEY (repo_path, name)
+);
+CREATE INDEX IF NOT EXISTS dependencies_name ON dependencies(name);
+CREATE INDEX IF NOT EXISTS repos_license ON repos(license);
+CREATE INDEX IF NOT EXISTS repos_last_commit_date ON repos(last_commit_date);
+"""
 
-    print(f"🎉 Beautiful README generated at {output_path}")
+# Catalog columns filled in by each repository probe
+CATALOG_PROBE_COLUMNS = {
+    'remote': ['remote_url'],
+    'last_commit': ['last_commit', 'last_commit_date'],
+}
+
+def open_catalog(path):
+    """Open the SQLite catalog of generated READMEs, creating its tables if needed"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Parallel runs wait for each other's writes instead of failing with "database is locked"
+    connection = sqlite3.connect(path, timeout=30)
+    connection.row_factory = sqlite3.Row
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA foreign_keys=ON')
+    connection.executescript(CATALOG_SCHEMA)
+    return connection
+
+def catalog_entry(repo_path, rev, user_input, repo_data, result):
+    """Collect one repository's row and dependencies for the catalog"""
+    versions = repo_data.get('dependency_versions') or {}
+    metadata = repo_data.get('dependency_metadata') or {}
+    timings = dict(repo_data.get('probe_timings') or {})
+    if result and 'render_seconds' in result:
+        timings['render'] = result['render_seconds']
+    return {
+        'repo_path': os.path.abspath(repo_path),
+        'rev': rev,
+        'name': user_input['name'],
+        'remote_url': repo_data.get('remote_url'),
+        'license': user_input['license'],
+        'theme': (result or {}).get('theme'),
+        'output_path': (result or {}).get('output_path'),
+        'output_hash': (result or {}).get('output_hash'),
+        'last_commit': repo_data.get('last_commit'),
+        'last_commit_date': repo_data.get('last_commit_date'),
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'timings': json.dumps(timings, sort_keys=True),
+        'failed_probes': sorted(repo_data.get('probe_failures') or {}),
+        'dependencies': [{
+            'name': normalize_dep_name(dep),
+            'spec': dep,
+            'version': versions.get(dep) or (metadata.get(dep) or {}).get('version'),
+            'license': (metadata.get(dep) or {}).get('license'),
+        } for dep in repo_data.get('dependencies') or []],
+    }
+
+def update_catalog(path, entries):
+    """Upsert catalog entries in a single transaction.
 
-    # Create license file if requested
-    if user_input.get('license') != 'NONE':
-        create_license(user_input['license'], user_input['author'])
+    Values a failed probe should have provided are left as the last
+    successful run recorded them. The catalog is a side record of the run,
+    so a locked or unwritable database only produces a warning.
+    """
+    columns = ['repo_path', 'rev', 'name', 'remote_url', 'license', 'theme', 'output_path',
+               'output_hash', 'last_commit', 'last_commit_date', 'generated_at', 'timings']
+    upsert_dependency = ("INSERT INTO dependencies (repo_path, name, spec, version, license) VALUES (?, ?, ?, ?, ?) "
+                         "ON CONFLICT(repo_path, name) DO UPDATE SET spec = excluded.spec, version = excluded.version, license = excluded.license")
+
+    try:
+        connection = open_catalog(path)
+        try:
+            with connection:
+                for entry in entries:
+                    kept = {column for probe in entry['failed_probes'] for column in CATALOG_PROBE_COLUMNS.get(probe, ())}
+                    assignments = ', '.join(f'{c} = COALESCE(excluded.{c}, repos.{c})' if c in kept else f'{c} = excluded.{c}'
+                                            for c in columns[1:])
+                    connection.execute(
+                        f"INSERT INTO repos ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                        f"ON CONFLICT(repo_path) DO UPDATE SET {assignments}",
+                        [entry[c] for c in columns])
+                    if 'dependencies' in entry['failed_probes']:
+                        continue
+                    names = [dep['name'] for dep in entry['dependencies']]
+                    connection.execute(
+                        f"DELETE FROM dependencies WHERE repo_path = ? AND name NOT IN ({', '.join('?' * len(names))})",
+                        [entry['repo_path']] + names)
+                    connection.executemany(upsert_dependency, [
+                        (entry['repo_path'], dep['name'], dep['spec'], dep['version'], dep['license'])
+                        for dep in entry['dependencies']])
+        finally:
+            connection.close()
+    except (sqlite3.DatabaseError, OSError) as e:
+        print(f"⚠️  Could not record this run in the catalog {path}: {e}")
+
+def query_catalog(path, dependency=None, license_name=None, stale_days=None):
+    """Look up cataloged repositories by dependency, license and last commit date"""
+    sql = "SELECT DISTINCT repos.* FROM repos"
+    conditions = []
+    params = []
+    if dependency:
+        sql += " JOIN dependencies ON dependencies.repo_path = repos.repo_path"
+        conditions.append("dependencies.name = ?")
+        params.append(normalize_dep_name(dependency))
+    if license_name:
+        conditions.append("repos.license = ?")
+        params.append(license_name)
+    if stale_days is not None:
+        conditions.append("repos.last_commit_date < ?")
+        params.append((date.today() - timedelta(days=stale_days)).isoformat())
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY repos.repo_path"
+
+    connection = open_catalog(path)
+    try:
+        return [dict(row) for row in connection.execute(sql, params)]
+    finally:
+        connection.close()
+
+def run_query(args):
+    """Print repositories in the catalog matching the query options"""
+    if not os.path.exists(args.catalog):
+        print(f"❌ No catalog at {args.catalog} yet, generate some READMEs first")
+        return
+    try:
+        rows = query_catalog(args.catalog, args.dependency, args.license, args.stale_days)
+    except (sqlite3.DatabaseError, OSError) as e:
+        print(f"❌ Could not read the catalog {args.catalog}: {e}")
+        return
+    for row in rows:
+        print(f"{row['repo_path']}  license={row['license']}  last_commit={row['last_commit_date'] or '-'}  generated={row['generated_at']}")
+    print(f"🔎 {len(rows)} matching repositor{'y' if len(rows) == 1 else 'ies'}")
 
 def main():
     parser = argparse.ArgumentParser(description="Generate a professional README for your project.")
     parser.add_argument("--output", "-o", default="README.md", help="Output file path (default: README.md)")
     parser.add_argument("--interactive", "-i", action="store_true", help="Run in interactive mode to ask questions")
+    parser.add_argument("--repo", default=".", help="Path to the git repository to analyze, bare or not (default: current directory)")
+    parser.add_argument("--rev", default=None, help="Revision to read manifests from, without checking it out (default: working tree, or HEAD for bare repos)")
+    parser.add_argument("--workspace", "-w", action="store_true", help="Generate a README for every workspace package plus a root index")
+    parser.add_argument("--workspace-glob", action="append", default=None, help="Glob of package directories, overriding workspace definitions (repeatable)")
+    parser.add_argument("--probe-timeout", type=float, default=None, help="Deadline in seconds for each repository probe (default: per-probe, 5-30s)")
+    parser.add_argument("--gallery", metavar="DIR", default=None, help="Add a screenshot gallery from images in DIR, relative to the README (e.g. docs/screenshots)")
+    parser.add_argument("--merge", "-m", action="store_true", help="Only update generated sections of an existing README, keeping hand-written content")
+    parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="file", help="How written files are flushed to disk: none, file, or full (file and directory) (default: file)")
+    parser.add_argument("--catalog", default=None, help="SQLite catalog recording every run (default: catalog.sqlite in the cache directory)")
+    parser.add_argument("--no-catalog", action="store_true", help="Don't record this run in the catalog")
+
+    subparsers = parser.add_subparsers(dest="command")
+    query_parser = subparsers.add_parser("query", help="Query the catalog of generated READMEs")
+    query_parser.add_argument("--dependency", "-d", default=None, help="Repositories depending on this package")
+    query_parser.add_argument("--license", "-l", default=None, help="Repositories with this license (NONE for no license)")
+    query_parser.add_argument("--stale-days", type=int, default=None, help="Repositories whose last commit is older than this many days")
+    # SUPPRESS keeps a --catalog given before the subcommand from being reset
+    query_parser.add_argument("--catalog", default=argparse.SUPPRESS, help="SQLite catalog to query (default: catalog.sqlite in the cache directory)")
 
     args = parser.parse_args()
+    args.catalog = args.catalog or os.path.join(get_cache_dir(), 'catalog.sqlite')
+
+    if args.command == "query":
+        run_query(args)
+        return
+
+    if args.workspace and args.rev:
+        print("❌ --rev is not supported with --workspace, which reads package manifests from the working tree")
+        sys.exit(1)
 
-    repo_data = get_repo_data()
+    # A wrong --repo or --rev is a user error, not a probe to degrade gracefully
+    try:
+        repo = git.Repo(args.repo)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        print(f"❌ {args.repo} is not a git repository")
+        sys.exit(1)
+    if args.rev or repo.bare:
+        try:
+            repo.commit(args.rev or 'HEAD')
+        except (git.BadName, ValueError):
+            print(f"❌ Revision {args.rev or 'HEAD'} not found in {args.repo}")
+            sys.exit(1)
 
     if args.interactive:
         user_input = get_user_input()
-        generate_readme(user_input, repo_data, args.output)
     else:
         # Default values for non-interactive mode
         user_input = {
@@ -411,8 +2316,21 @@ def main():
             'include_usage': True,
             'include_contributing': True,
             'include_fun_gifs': False,
+            'include_gallery': False,
+            'gallery_dir': '',
         }
-        generate_readme(user_input, repo_data, args.output)
+
+    if args.gallery:
+        user_input['include_gallery'] = True
+        user_input['gallery_dir'] = args.gallery
+
+    if args.workspace:
+        generate_workspace(user_input, args.repo, args.output, globs=args.workspace_glob, merge=args.merge, timeout=args.probe_timeout, fsync=args.fsync, catalog=None if args.no_catalog else args.catalog)
+    else:
+        repo_data = get_repo_data(args.repo, args.rev, timeout=args.probe_timeout)
+        result = generate_readme(user_input, repo_data, args.output, merge=args.merge, fsync=args.fsync)
+        if not args.no_catalog:
+            update_catalog(args.catalog, [catalog_entry(args.repo, args.rev, user_input, repo_data, result)])
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()